@@ -0,0 +1,70 @@
+import os
+import sys
+import csv
+import time
+import subprocess
+
+PIPELINE_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "Final python pipeline vizualization")
+
+# Modules that mean the HTTP / env stack was loaded
+NETWORK_MODULES = {"requests", "urllib3", "dotenv", "http.client", "ssl", "socket"}
+
+SCENARIOS = [
+    ("import path_optimizer", "import path_optimizer"),
+    ("import api_ip_part", "import api_ip_part"),
+    ("import api_op_part", "import api_op_part"),
+    ("import elist_ant_system", "import elist_ant_system"),
+    ("import cli", "import cli"),
+    ("solve cached matrix", (
+        "import path_optimizer; "
+        "path_optimizer.run_optimizer({'locations': ['A', 'B', 'C', 'D'], "
+        "'matrix': [[0, 5, 9, 4], [5, 0, 4, 7], [9, 4, 0, 3], [4, 7, 3, 0]]})"
+    )),
+]
+
+def measure(code):
+    """Run ``code`` in a fresh interpreter with -X importtime."""
+    start_time = time.time()
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        cwd=PIPELINE_DIR, capture_output=True, text=True
+    )
+    wall_ms = round((time.time() - start_time) * 1000, 1)
+
+    import_us = 0
+    modules = set()
+    for line in proc.stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        self_us, _, name = line[len("import time:"):].split("|")
+        import_us += int(self_us)
+        modules.add(name.strip())
+
+    return {
+        "ok": proc.returncode == 0,
+        "wall_ms": wall_ms,
+        "import_ms": round(import_us / 1000, 1),
+        "modules": len(modules),
+        "network_modules": " ".join(sorted(modules & NETWORK_MODULES))
+    }
+
+def main():
+    results = []
+    for name, code in SCENARIOS:
+        result = {"scenario": name, **measure(code)}
+        results.append(result)
+        print(f"{name}: {result['import_ms']} ms in imports, {result['wall_ms']} ms wall, "
+              f"network: {result['network_modules'] or 'none'}")
+
+    with open("import_results.csv", "w", newline="") as csvfile:
+        writer = csv.DictWriter(csvfile, fieldnames=[
+            "scenario", "ok", "wall_ms", "import_ms", "modules", "network_modules"
+        ])
+        writer.writeheader()
+        for row in results:
+            writer.writerow(row)
+
+    print("\nCold start benchmark complete. Results saved to import_results.csv")
+
+if __name__ == "__main__":
+    main()
@@ -1,13 +1,20 @@
 import os
+import gc
+import sys
 import time
 import json
 import csv
+import tracemalloc
 
 # Adjusted imports
 from algos.aco import solve_tsp as solve_aco
 from algos.elitist import solve_tsp as solve_elist
 from algos.genetic import solve_tsp as solve_genetic
 from algos.minmax import solve_tsp as solve_minmax
+from algos.acs import solve_tsp as solve_acs
+from algos.portfolio import solve_tsp as solve_portfolio
+from algos.island import solve_tsp as solve_island
+from algos.bound import lower_bound, optimality_gap
 
 ACO_PARAMS = {
     "num_ants": 20,
@@ -20,27 +27,65 @@ ACO_PARAMS = {
 
 EAS_PARAMS = {**ACO_PARAMS, "elitist_factor": 5}
 MMAS_PARAMS = {**ACO_PARAMS, "pheromone_min": 0.1, "pheromone_max": 10.0}
+ACS_PARAMS = {
+    "num_ants": 10,
+    "num_iterations": 100,
+    "beta": 5.0,
+    "evaporation_rate": 0.1,
+    "q0": 0.9,
+    "local_evaporation": 0.1,
+    "candidate_size": 15
+}
 GA_PARAMS = {
     "population_size": 200,
     "num_generations": 500,
     "mutation_rate": 0.1,
     "elitism_rate": 0.3
 }
+# Races EAS, MMAS, ACS and GA; each run's winner is appended to the record file
+PORTFOLIO_PARAMS = {
+    "time_budget": 5.0,
+    "record_file": "portfolio_results.jsonl"
+}
 
 def load_data(filepath):
     with open(filepath, "r") as f:
         data = json.load(f)
     return data["locations"], data["matrix"]
 
+# Set to e.g. 0.02 to let solvers stop once within 2% of the lower bound;
+# time_sec then measures time-to-target cost
+GAP_EPSILON = None
+
+# Tracing allocations slows the solvers down, so keep it off for timing runs
+TRACE_ALLOCATIONS = False
+
+def gc_collections():
+    return sum(stat["collections"] for stat in gc.get_stats())
+
 def evaluate_algorithm(name, solver_func, matrix, params):
+    if TRACE_ALLOCATIONS:
+        tracemalloc.start()
+    collections = gc_collections()
+    blocks = sys.getallocatedblocks()
     start_time = time.time()
     path = solver_func(matrix, params)
     duration = round(time.time() - start_time, 4)
+    # Net change in allocated memory blocks across the solve
+    blocks = sys.getallocatedblocks() - blocks
+    collections = gc_collections() - collections
+    peak_kb = ""
+    if TRACE_ALLOCATIONS:
+        peak_kb = round(tracemalloc.get_traced_memory()[1] / 1024, 1)
+        tracemalloc.stop()
     cost = sum(matrix[path[i]][path[i + 1]] for i in range(len(path) - 1))
     return {
         "algorithm": name,
         "cost": round(cost, 2),
         "time_sec": duration,
+        "gc_collections": collections,
+        "allocated_blocks": blocks,
+        "peak_kb": peak_kb,
         "path": path
     }
 
@@ -53,25 +98,33 @@ def main():
     for file in json_files:
         locations, matrix = load_data(os.path.join(input_dir, file))
         num_nodes = len(locations)
+        bound = lower_bound(matrix)
+        stopping = {} if GAP_EPSILON is None else {"gap_epsilon": GAP_EPSILON, "lower_bound": bound}
 
         for name, func, params in [
             ("ACO", solve_aco, ACO_PARAMS),
             ("EAS", solve_elist, EAS_PARAMS),
             ("MMAS", solve_minmax, MMAS_PARAMS),
-            ("GA", solve_genetic, GA_PARAMS)
+            ("ACS", solve_acs, ACS_PARAMS),
+            ("GA", solve_genetic, GA_PARAMS),
+            ("GA-ISLAND", solve_island, GA_PARAMS),
+            ("PORTFOLIO", solve_portfolio, PORTFOLIO_PARAMS)
         ]:
-            result = evaluate_algorithm(name, func, matrix, params)
+            result = evaluate_algorithm(name, func, matrix, {**params, **stopping})
             result.update({
                 "filename": file,
-                "num_nodes": num_nodes
+                "num_nodes": num_nodes,
+                "lower_bound": round(bound, 2),
+                "gap_pct": round(100 * optimality_gap(result["cost"], bound), 2)
             })
             results.append(result)
-            print(f"Completed: {name} on {file} -> Cost: {result['cost']}, Time: {result['time_sec']}s")
+            print(f"Completed: {name} on {file} -> Cost: {result['cost']}, Gap: {result['gap_pct']}%, Time: {result['time_sec']}s")
 
     # Write CSV output
     with open("benchmark_results_03.csv", "w", newline="") as csvfile:
         writer = csv.DictWriter(csvfile, fieldnames=[
-            "algorithm", "filename", "num_nodes", "cost", "time_sec", "path"
+            "algorithm", "filename", "num_nodes", "cost", "lower_bound", "gap_pct", "time_sec",
+            "gc_collections", "allocated_blocks", "peak_kb", "path"
         ])
         writer.writeheader()
         for row in results:
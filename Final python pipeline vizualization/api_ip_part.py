@@ -1,7 +1,5 @@
-import requests
 import time
 import os
-from dotenv import load_dotenv
 import json
 
 url = "https://maps.googleapis.com/maps/api/distancematrix/json"
@@ -9,6 +7,7 @@ url = "https://maps.googleapis.com/maps/api/distancematrix/json"
 
 # function for fetching key
 def fetch_key(file = "key.env"):
+    from dotenv import load_dotenv
     load_dotenv(file)
     key = os.getenv("my_api_key")
     if(not key):
@@ -25,6 +24,7 @@ def get_locations(file = "locations.txt"):
 
 # function to create time matrix
 def get_time_matrix(locations):
+    import requests
     n = len(locations)
     matrix = [[0]*n for _ in range(n)]
     key = fetch_key()
@@ -65,10 +65,11 @@ def save_matrix_json(locations , matrix, file="matrix.json"):
 
 
 # main function
-def main():
-    locations = get_locations()
+def main(locations_file="locations.txt", matrix_file="matrix.json"):
+    locations = get_locations(locations_file)
     matrix = get_time_matrix(locations)
-    save_matrix_json(locations,matrix)
+    save_matrix_json(locations,matrix,matrix_file)
 
 
-main()
\ No newline at end of file
+if __name__ == "__main__":
+    main()
@@ -1,12 +1,11 @@
 import json 
 import urllib.parse
-import requests
-from dotenv import load_dotenv
 import os
 
 
 #func for fetching key
 def fetch_key(file = "key.env"):
+    from dotenv import load_dotenv
     load_dotenv(file)
     key = os.getenv("my_api_key")
     if(not key):
@@ -23,6 +22,7 @@ def load_locations(file = "output.json"):
 
 #func to get polyline output
 def get_polyline(locations , api_key):
+    import requests
     origin = urllib.parse.quote(locations[0])
     destination = urllib.parse.quote(locations[-1])
     waypoints = "|".join([urllib.parse.quote(loc) for loc in locations[1:-1]])
@@ -43,15 +43,16 @@ def get_polyline(locations , api_key):
 
 
 #main func
-def main():
+def main(route_file="output.json", polyline_file="polyline_op.json"):
     api_key = fetch_key()
-    locations = load_locations()
+    locations = load_locations(route_file)
     polyline = get_polyline(locations,api_key)
 
-    with open("polyline_op.json","w") as f:
+    with open(polyline_file,"w") as f:
         json.dump({"polyline" : polyline},f, indent=2)
     
     print("Polyline saved for output")
 
 
-main()
\ No newline at end of file
+if __name__ == "__main__":
+    main()
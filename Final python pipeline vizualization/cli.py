@@ -0,0 +1,50 @@
+import argparse
+
+# Pipeline modules are imported inside each command, so `solve` on a cached
+# matrix never loads requests or dotenv.
+
+
+def cmd_matrix(args):
+    from api_ip_part import main
+    main(args.locations, args.output)
+
+def cmd_solve(args):
+    # Same solver choice as run_optimizer: exact DP, EAS or decomposition
+    from elist_ant_system import display_map, load_input, save_output
+    from path_optimizer import EAS_PARAMS, solve_route
+    locations, matrix = load_input(args.input)
+    display_map(locations)
+    path = solve_route(matrix, EAS_PARAMS)
+    save_output(path, locations, matrix, args.output)
+
+def cmd_polyline(args):
+    from api_op_part import main
+    main(args.input, args.output)
+
+def build_parser():
+    parser = argparse.ArgumentParser(description="LogisticsAI route pipeline")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    matrix = commands.add_parser("matrix", help="fetch the travel time matrix for a locations file")
+    matrix.add_argument("--locations", default="locations.txt")
+    matrix.add_argument("--output", default="matrix.json")
+    matrix.set_defaults(func=cmd_matrix)
+
+    solve = commands.add_parser("solve", help="optimize the route for a cached matrix")
+    solve.add_argument("--input", default="matrix.json")
+    solve.add_argument("--output", default="output.json")
+    solve.set_defaults(func=cmd_solve)
+
+    polyline = commands.add_parser("polyline", help="fetch the map polyline for an optimized route")
+    polyline.add_argument("--input", default="output.json")
+    polyline.add_argument("--output", default="polyline_op.json")
+    polyline.set_defaults(func=cmd_polyline)
+
+    return parser
+
+def main(argv=None):
+    args = build_parser().parse_args(argv)
+    args.func(args)
+
+if __name__ == "__main__":
+    main()
@@ -111,8 +111,11 @@ def save_output(path, locations, matrix, output_file="output.json"):
     print("Total Time:", result["total_time"], "mins")
 
 # ========== Block 6: Main Driver ==========
-if __name__ == "__main__":
-    locations, matrix = load_input()
+def main(input_file="matrix.json", output_file="output.json"):
+    locations, matrix = load_input(input_file)
     display_map(locations)  # Display the map to the user
     path = solve_tsp(matrix, EAS_PARAMS)
-    save_output(path, locations, matrix)
+    save_output(path, locations, matrix, output_file)
+
+if __name__ == "__main__":
+    main()
@@ -1,10 +1,21 @@
-import requests
+import os
+import sys
 import time
-import random
-from typing import List, Dict
+from typing import List
+
+# The shared optimizers live in the top-level algos package. Fall back to the
+# repository root when the caller has not put it on the path.
+try:
+    from algos.dispatch import solve_tsp as solve_route
+except ModuleNotFoundError as e:
+    if e.name != "algos":
+        raise
+    sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+    from algos.dispatch import solve_tsp as solve_route
 
 # API KEY directly passed from Flutter
 def get_time_matrix(locations: List[str], api_key: str) -> List[List[int]]:
+    import requests  # imported lazily so solving a cached matrix skips the HTTP stack
     n = len(locations)
     matrix = [[0] * n for _ in range(n)]
     url = "https://maps.googleapis.com/maps/api/distancematrix/json"
@@ -44,58 +55,8 @@ EAS_PARAMS = {
     "elitist_factor": 5
 }
 
-def solve_tsp(matrix: List[List[int]], params: Dict) -> List[int]:
-    n = len(matrix)
-    pheromone = [[1.0 for _ in range(n)] for _ in range(n)]
-    heuristic = [[0 if i == j else 1 / matrix[i][j] for j in range(n)] for i in range(n)]
-    best_path = None
-    best_cost = float('inf')
-    for _ in range(params["num_iterations"]):
-        all_paths = []
-        all_costs = []
-        for _ in range(params["num_ants"]):
-            path = [0]
-            unvisited = set(range(1, n))
-            while unvisited:
-                current = path[-1]
-                probabilities = []
-                for city in unvisited:
-                    tau = pheromone[current][city] ** params["alpha"]
-                    eta = heuristic[current][city] ** params["beta"]
-                    probabilities.append((city, tau * eta))
-                total = sum(p[1] for p in probabilities)
-                r = random.uniform(0, total)
-                cumulative = 0
-                for city, prob in probabilities:
-                    cumulative += prob
-                    if cumulative >= r:
-                        path.append(city)
-                        unvisited.remove(city)
-                        break
-            path.append(0)
-            cost = sum(matrix[path[i]][path[i + 1]] for i in range(len(path) - 1))
-            all_paths.append(path)
-            all_costs.append(cost)
-            if cost < best_cost:
-                best_cost = cost
-                best_path = path
-        for i in range(n):
-            for j in range(n):
-                pheromone[i][j] *= (1 - params["evaporation_rate"])
-        for k in range(len(all_paths)):
-            path = all_paths[k]
-            cost = all_costs[k]
-            for i in range(len(path) - 1):
-                a = path[i]
-                b = path[i + 1]
-                pheromone[a][b] += params["pheromone_constant"] / cost
-                pheromone[b][a] = pheromone[a][b]
-        for i in range(len(best_path) - 1):
-            a = best_path[i]
-            b = best_path[i + 1]
-            pheromone[a][b] += params["elitist_factor"] * (params["pheromone_constant"] / best_cost)
-            pheromone[b][a] = pheromone[a][b]
-    return best_path
+# Portfolio runs record which solver won here, to guide future dispatch
+PORTFOLIO_RECORD_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "portfolio_results.jsonl")
 
 # Main callable function from Flutter
 def run_optimizer(input_data):
@@ -104,8 +65,15 @@ def run_optimizer(input_data):
     if not locations or len(locations) < 2:
         return "Error: At least two locations required"
 
-    matrix = get_time_matrix(locations, api_key)
-    path = solve_tsp(matrix, EAS_PARAMS)
+    # A cached matrix can be passed in to skip the Distance Matrix API entirely
+    matrix = input_data.get("matrix") or get_time_matrix(locations, api_key)
+    # Exact DP for small routes, EAS or decomposition for larger ones. With a
+    # latency budget, larger routes race all solvers and keep the best tour.
+    params = EAS_PARAMS
+    if input_data.get("time_budget"):
+        params = {**EAS_PARAMS, "time_budget": input_data["time_budget"], "portfolio": True,
+                  "record_file": PORTFOLIO_RECORD_FILE}
+    path = solve_route(matrix, params)
     route = [locations[i].replace(" ", "+") for i in path]
 
     # Return a URL-safe Google Maps path string
@@ -1,97 +1,51 @@
-import random
+from .bound import target_cost
+from .stopping import should_stop
+from .colony import colony_state
 
-def initialize_pheromone_matrix(n):
-    """Initialize the pheromone matrix with uniform values."""
-    return [[1.0 for _ in range(n)] for _ in range(n)]
-
-def initialize_heuristic_matrix(matrix, n):
-    """Initialize the heuristic matrix based on the distance matrix."""
-    return [[0 if i == j else 1 / matrix[i][j] for j in range(n)] for i in range(n)]
-
-def select_next_city(current, unvisited, pheromone, heuristic, params):
-    """Select the next city based on pheromone and heuristic values."""
-    probabilities = []
-    for city in unvisited:
-        tau = pheromone[current][city] ** params["alpha"]
-        eta = heuristic[current][city] ** params["beta"]
-        probabilities.append((city, tau * eta))
-
-    total = sum(p[1] for p in probabilities)
-    r = random.uniform(0, total)
-    cumulative = 0
-
-    for city, prob in probabilities:
-        cumulative += prob
-        if cumulative >= r:
-            return city
-
-def construct_solution(n, pheromone, heuristic, params):
-    """Construct a single solution (path) using ACO."""
-    path = [0]
-    unvisited = set(range(1, n))
-
-    while unvisited:
-        current = path[-1]
-        next_city = select_next_city(current, unvisited, pheromone, heuristic, params)
-        path.append(next_city)
-        unvisited.remove(next_city)
-
-    path.append(0)  # return to the start city
-    return path
-
-def calculate_cost(path, matrix):
-    """Calculate the cost of a given path."""
-    return sum(matrix[path[i]][path[i + 1]] for i in range(len(path) - 1))
-
-def update_pheromone_matrix(pheromone, all_paths, all_costs, best_path, best_cost, params, n):
-    """Update the pheromone matrix based on evaporation, reinforcement, and elitism."""
+def update_pheromone(state, best_path, best_cost, params):
+    """Update the pheromone buffer based on evaporation, reinforcement, and elitism."""
     # Evaporation
-    for i in range(n):
-        for j in range(n):
-            pheromone[i][j] *= (1 - params["evaporation_rate"])
+    state.evaporate(params["evaporation_rate"])
 
     # Reinforcement by all ants
-    for k in range(len(all_paths)):
-        path = all_paths[k]
-        cost = all_costs[k]
-        for i in range(len(path) - 1):
-            a = path[i]
-            b = path[i + 1]
-            pheromone[a][b] += params["pheromone_constant"] / cost
-            pheromone[b][a] = pheromone[a][b]
+    for k in range(state.num_ants):
+        state.deposit(k, params["pheromone_constant"] / state.costs[k])
+
+    # Elitist reinforcement (best path only), skipped for plain ACO params
+    if params.get("elitist_factor"):
+        state.deposit_path(best_path, params["elitist_factor"] * (params["pheromone_constant"] / best_cost))
 
-    # Elitist reinforcement (best path only)
-    for i in range(len(best_path) - 1):
-        a = best_path[i]
-        b = best_path[i + 1]
-        pheromone[a][b] += params["elitist_factor"] * (params["pheromone_constant"] / best_cost)
-        pheromone[b][a] = pheromone[a][b]
+def solve_tsp(matrix, params, state=None):
+    """Solve the TSP problem using Ant Colony Optimization.
 
-def solve_tsp(matrix, params):
-    """Solve the TSP problem using Ant Colony Optimization."""
+    Pass a ColonyState from ``algos.colony`` as ``state`` to reuse its buffers
+    across solves; set ``params["float32"]`` to store pheromone in float32
+    and ``params["warm_start"]`` to keep the pheromone already in ``state``.
+    """
     n = len(matrix)
-    pheromone = initialize_pheromone_matrix(n)
-    heuristic = initialize_heuristic_matrix(matrix, n)
+    state = colony_state(n, params, state)
+    state.reset(matrix, 1.0, params["beta"], params.get("warm_start", False))
+
+    target = target_cost(matrix, params)
 
     best_path = None
     best_cost = float('inf')
 
     for _ in range(params["num_iterations"]):
-        all_paths = []
-        all_costs = []
-
         # Simulate all ants' paths
-        for _ in range(params["num_ants"]):
-            path = construct_solution(n, pheromone, heuristic, params)
-            cost = calculate_cost(path, matrix)
-            all_paths.append(path)
-            all_costs.append(cost)
+        for k in range(params["num_ants"]):
+            state.construct(k, params["alpha"])
+            cost = state.evaluate(k, matrix)
 
             if cost < best_cost:
                 best_cost = cost
-                best_path = path
+                best_path = state.tour(k)
+
+        # Update pheromone buffer
+        update_pheromone(state, best_path, best_cost, params)
 
-        # Update pheromone matrix
-        update_pheromone_matrix(pheromone, all_paths, all_costs, best_path, best_cost, params, n)
+        # Stop at the target gap, the deadline or when cancelled
+        if should_stop(best_cost, target, params):
+            break
 
     return best_path
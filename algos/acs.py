@@ -0,0 +1,140 @@
+import random
+from array import array
+
+from .bound import nearest_neighbour_cost, target_cost
+from .colony import colony_state
+from .stopping import should_stop
+
+Q0 = 0.9
+LOCAL_EVAPORATION = 0.1
+CANDIDATE_SIZE = 15
+
+
+def candidate_lists(matrix, size):
+    """The ``size`` nearest other nodes of every node, closest first."""
+    n = len(matrix)
+    return [sorted((j for j in range(n) if j != i), key=lambda j: matrix[i][j])[:size] for i in range(n)]
+
+def construct(state, k, candidates, params, tau0, visited):
+    """Build ant ``k``'s tour with the pseudo-random proportional rule.
+
+    With probability q0 the ant takes the best unvisited candidate,
+    otherwise it samples among the unvisited candidates in proportion to
+    tau * eta^beta. Only when every candidate is visited is the full
+    unvisited set scanned. Options are gathered into the state's
+    ``unvisited`` buffer, so a step allocates nothing. Each traversed edge
+    gets the local update tau = (1 - xi) * tau + xi * tau0.
+    """
+    n = state.n
+    pheromone = state.pheromone
+    heuristic = state.heuristic
+    weights = state.weights
+    options = state.unvisited
+    tours = state.tours
+    q0 = params.get("q0", Q0)
+    xi = params.get("local_evaporation", LOCAL_EVAPORATION)
+    keep = 1 - xi
+    local = xi * tau0
+    for i in range(n):
+        visited[i] = 0
+    visited[0] = 1
+
+    base = k * (n + 1)
+    tours[base] = 0
+    current = 0
+    for step in range(1, n):
+        row = current * n
+        count = 0
+        for city in candidates[current]:
+            if not visited[city]:
+                options[count] = city
+                count += 1
+        if not count:
+            for city in range(n):
+                if not visited[city]:
+                    options[count] = city
+                    count += 1
+
+        if random.random() < q0:
+            chosen = options[0]
+            best = -1.0
+            for idx in range(count):
+                city = options[idx]
+                weight = pheromone[row + city] * heuristic[row + city]
+                if weight > best:
+                    best = weight
+                    chosen = city
+        else:
+            total = 0.0
+            for idx in range(count):
+                city = options[idx]
+                weight = pheromone[row + city] * heuristic[row + city]
+                weights[idx] = weight
+                total += weight
+            r = random.uniform(0, total)
+            cumulative = 0.0
+            chosen = options[count - 1]
+            for idx in range(count):
+                cumulative += weights[idx]
+                if cumulative >= r:
+                    chosen = options[idx]
+                    break
+
+        # Local pheromone update
+        edge = row + chosen
+        pheromone[edge] = keep * pheromone[edge] + local
+        pheromone[chosen * n + current] = pheromone[edge]
+
+        tours[base + step] = chosen
+        visited[chosen] = 1
+        current = chosen
+
+    tours[base + n] = 0
+    edge = current * n
+    pheromone[edge] = keep * pheromone[edge] + local
+    pheromone[current] = pheromone[edge]
+
+def solve_tsp(matrix, params, state=None):
+    """Solve the TSP using Ant Colony System.
+
+    Alpha is fixed at 1 as in ACS. Besides the usual ``num_ants``,
+    ``num_iterations``, ``beta`` and ``evaporation_rate`` (rho of the global
+    update), ``q0``, ``local_evaporation`` (xi) and ``candidate_size`` are
+    optional.
+    """
+    n = len(matrix)
+    if n < 2:
+        return [0] * (n + 1)
+    tau0 = 1 / (n * nearest_neighbour_cost(matrix))
+    state = colony_state(n, params, state)
+    state.reset(matrix, tau0, params["beta"], params.get("warm_start", False))
+    candidates = candidate_lists(matrix, params.get("candidate_size", CANDIDATE_SIZE))
+    visited = array("b", [0]) * n
+    rho = params["evaporation_rate"]
+
+    target = target_cost(matrix, params)
+
+    best_path = None
+    best_cost = float('inf')
+
+    for _ in range(params["num_iterations"]):
+        for k in range(params["num_ants"]):
+            construct(state, k, candidates, params, tau0, visited)
+            cost = state.evaluate(k, matrix)
+
+            if cost < best_cost:
+                best_cost = cost
+                best_path = state.tour(k)
+
+        # Global update on the best-so-far tour only
+        pheromone = state.pheromone
+        deposit = rho / best_cost
+        for i in range(n):
+            a = best_path[i] * n + best_path[i + 1]
+            pheromone[a] = (1 - rho) * pheromone[a] + deposit
+            pheromone[best_path[i + 1] * n + best_path[i]] = pheromone[a]
+
+        if should_stop(best_cost, target, params):
+            break
+
+    return best_path
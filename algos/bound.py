@@ -0,0 +1,154 @@
+import math
+
+
+def is_symmetric(matrix):
+    """Check whether the cost matrix is symmetric."""
+    n = len(matrix)
+    return all(matrix[i][j] == matrix[j][i] for i in range(n) for j in range(i + 1, n))
+
+def tour_cost(path, matrix):
+    """Calculate the cost of a closed path."""
+    return sum(matrix[path[i]][path[i + 1]] for i in range(len(path) - 1))
+
+def nearest_neighbour_tour(matrix):
+    """Greedy tour from node 0 that always moves to the closest unvisited node."""
+    n = len(matrix)
+    unvisited = set(range(1, n))
+    path = [0]
+    while unvisited:
+        current = path[-1]
+        nxt = min(unvisited, key=lambda city: matrix[current][city])
+        path.append(nxt)
+        unvisited.remove(nxt)
+    path.append(0)
+    return path
+
+def nearest_neighbour_cost(matrix):
+    """Cost of the nearest neighbour tour from node 0, used as an upper bound."""
+    return tour_cost(nearest_neighbour_tour(matrix), matrix)
+
+def one_tree(cost, pi):
+    """Return the weight and node degrees of a minimum 1-tree.
+
+    Edge (i, j) is weighted cost[i][j] + pi[i] + pi[j]. Nodes 1..n-1 are
+    spanned with Prim's algorithm and node 0 is joined by its two cheapest
+    edges.
+    """
+    n = len(cost)
+    degree = [0] * n
+    in_tree = [False] * n
+    dist = [math.inf] * n
+    parent = [0] * n
+    weight = 0.0
+
+    dist[1] = 0.0
+    for _ in range(n - 1):
+        node = -1
+        for j in range(1, n):
+            if not in_tree[j] and (node < 0 or dist[j] < dist[node]):
+                node = j
+        in_tree[node] = True
+        if node != 1:
+            weight += dist[node]
+            degree[node] += 1
+            degree[parent[node]] += 1
+        row = cost[node]
+        for j in range(1, n):
+            if not in_tree[j]:
+                d = row[j] + pi[node] + pi[j]
+                if d < dist[j]:
+                    dist[j] = d
+                    parent[j] = node
+
+    first, second = sorted(range(1, n), key=lambda j: cost[0][j] + pi[j])[:2]
+    weight += cost[0][first] + cost[0][second] + 2 * pi[0] + pi[first] + pi[second]
+    degree[0] = 2
+    degree[first] += 1
+    degree[second] += 1
+    return weight, degree
+
+def held_karp_bound(matrix, iterations=100, upper_bound=None):
+    """Held-Karp lower bound of a symmetric TSP via subgradient optimization.
+
+    The node penalties pi are moved along the degree violations of the
+    current minimum 1-tree with Polyak steps towards ``upper_bound`` (the
+    nearest neighbour tour cost by default). Returns the best bound seen.
+    """
+    n = len(matrix)
+    if n < 3:
+        return tour_cost(list(range(n)) + [0], matrix) if n > 1 else 0
+    if upper_bound is None:
+        upper_bound = nearest_neighbour_cost(matrix)
+
+    pi = [0.0] * n
+    best = -math.inf
+    scale = 2.0
+    stall = 0
+    for _ in range(iterations):
+        weight, degree = one_tree(matrix, pi)
+        bound = weight - 2 * sum(pi)
+        if bound > best + 1e-9:
+            best = bound
+            stall = 0
+        else:
+            stall += 1
+            if stall >= 5:
+                scale /= 2
+                stall = 0
+
+        norm = sum((d - 2) ** 2 for d in degree)
+        if norm == 0 or best >= upper_bound or scale < 1e-4:
+            # A 1-tree where every degree is 2 is an optimal tour
+            break
+        step = scale * (upper_bound - bound) / norm
+        pi = [pi[i] + step * (degree[i] - 2) for i in range(n)]
+
+    return best
+
+def reduction_bound(matrix):
+    """Row and column reduction bound, valid for asymmetric matrices."""
+    n = len(matrix)
+    rows = [min(matrix[i][j] for j in range(n) if j != i) for i in range(n)]
+    cols = [min(matrix[i][j] - rows[i] for i in range(n) if i != j) for j in range(n)]
+    return sum(rows) + sum(cols)
+
+def lower_bound(matrix, iterations=100, upper_bound=None):
+    """Lower bound on the cost of any tour through ``matrix``.
+
+    Symmetric matrices get the Held-Karp bound. For asymmetric matrices the
+    Held-Karp bound of min(c_ij, c_ji) is combined with the reduction bound.
+    Integer matrices have the bound rounded up, since every tour cost is an
+    integer.
+    """
+    n = len(matrix)
+    if n < 2:
+        return 0
+    if is_symmetric(matrix):
+        bound = held_karp_bound(matrix, iterations, upper_bound)
+    else:
+        relaxed = [[min(matrix[i][j], matrix[j][i]) for j in range(n)] for i in range(n)]
+        bound = max(held_karp_bound(relaxed, iterations, upper_bound), reduction_bound(matrix))
+
+    if all(isinstance(value, int) for row in matrix for value in row):
+        return math.ceil(bound - 1e-6)
+    return bound
+
+def optimality_gap(cost, bound):
+    """Relative gap of ``cost`` above ``bound`` (0.05 means within 5%)."""
+    if bound <= 0:
+        return 0.0 if cost <= bound else math.inf
+    return (cost - bound) / bound
+
+def target_cost(matrix, params):
+    """Cost at which a solver may stop early, or None when disabled.
+
+    Early termination is enabled by ``params["gap_epsilon"]``; the bound is
+    taken from ``params["lower_bound"]`` or computed from ``matrix``.
+    """
+    epsilon = params.get("gap_epsilon")
+    if epsilon is None:
+        return None
+    bound = params.get("lower_bound")
+    if bound is None:
+        bound = lower_bound(matrix)
+    return bound * (1 + epsilon)
@@ -0,0 +1,154 @@
+import random
+from array import array
+
+
+class ColonyState:
+    """Preallocated buffers shared by the ant system solvers.
+
+    Pheromone and heuristic values live in flat row-major ``array`` buffers
+    (index ``i * n + j``) instead of lists of lists, and ant tours and costs
+    are written into fixed slots, so an iteration allocates nothing beyond the
+    copy of an improved best tour. A state can be reused across iterations
+    and across solves of the same size.
+    """
+
+    __slots__ = ("n", "num_ants", "typecode", "pheromone", "heuristic",
+                 "weights", "unvisited", "order", "tours", "costs", "primed")
+
+    def __init__(self, n, num_ants, float32=False):
+        self.n = n
+        self.num_ants = num_ants
+        self.typecode = "f" if float32 else "d"
+        self.pheromone = array(self.typecode, [0.0]) * (n * n)
+        self.heuristic = array(self.typecode, [0.0]) * (n * n)
+        self.weights = array(self.typecode, [0.0]) * n
+        self.unvisited = array("i", range(1, n))
+        self.order = array("i", range(1, n))
+        self.tours = array("i", [0]) * (num_ants * (n + 1))
+        self.costs = array("d", [0.0]) * num_ants
+        # Whether the pheromone buffer holds values from an earlier reset
+        self.primed = False
+
+    def fits(self, n, num_ants, float32=False):
+        """Check whether the buffers can be reused for the given shape."""
+        return (self.n == n and self.num_ants == num_ants
+                and self.typecode == ("f" if float32 else "d"))
+
+    def reset(self, matrix, initial_pheromone, beta, keep_pheromone=False):
+        """Fill the pheromone buffer and precompute eta^beta for ``matrix``.
+
+        With ``keep_pheromone`` the pheromone learned by a previous solve is
+        left in place and only the heuristic is refreshed. A state that was
+        never reset has no learned pheromone, so it is always initialised.
+        """
+        n = self.n
+        keep_pheromone = keep_pheromone and self.primed
+        self.primed = True
+        pheromone = self.pheromone
+        heuristic = self.heuristic
+        for i in range(n):
+            row = matrix[i]
+            base = i * n
+            for j in range(n):
+                if not keep_pheromone:
+                    pheromone[base + j] = initial_pheromone
+                heuristic[base + j] = 0.0 if i == j else (1 / row[j]) ** beta
+
+    def construct(self, k, alpha):
+        """Build the tour of ant ``k`` in its slot of the tour buffer."""
+        n = self.n
+        pheromone = self.pheromone
+        heuristic = self.heuristic
+        weights = self.weights
+        unvisited = self.unvisited
+        tours = self.tours
+        unvisited[:] = self.order
+
+        base = k * (n + 1)
+        tours[base] = 0
+        current = 0
+        remaining = n - 1
+        for step in range(1, n):
+            row = current * n
+            total = 0.0
+            for idx in range(remaining):
+                edge = row + unvisited[idx]
+                weight = pheromone[edge] ** alpha * heuristic[edge]
+                weights[idx] = weight
+                total += weight
+
+            r = random.uniform(0, total)
+            cumulative = 0.0
+            chosen = remaining - 1
+            for idx in range(remaining):
+                cumulative += weights[idx]
+                if cumulative >= r:
+                    chosen = idx
+                    break
+
+            current = unvisited[chosen]
+            tours[base + step] = current
+            remaining -= 1
+            unvisited[chosen] = unvisited[remaining]
+
+        tours[base + n] = 0
+
+    def evaluate(self, k, matrix):
+        """Compute and store the cost of the tour of ant ``k``."""
+        n = self.n
+        tours = self.tours
+        base = k * (n + 1)
+        cost = 0
+        for i in range(base, base + n):
+            cost += matrix[tours[i]][tours[i + 1]]
+        self.costs[k] = cost
+        return cost
+
+    def tour(self, k):
+        """Return a copy of the tour of ant ``k`` as a list."""
+        base = k * (self.n + 1)
+        return self.tours[base:base + self.n + 1].tolist()
+
+    def evaporate(self, rate):
+        """Scale every pheromone value by ``1 - rate``."""
+        pheromone = self.pheromone
+        keep = 1 - rate
+        for i in range(len(pheromone)):
+            pheromone[i] *= keep
+
+    def deposit(self, k, amount):
+        """Add ``amount`` to both directions of every edge of ant ``k``'s tour."""
+        n = self.n
+        base = k * (n + 1)
+        self._deposit(self.tours, base, base + n, amount)
+
+    def deposit_path(self, path, amount):
+        """Add ``amount`` to both directions of every edge of ``path``."""
+        self._deposit(path, 0, len(path) - 1, amount)
+
+    def _deposit(self, path, start, end, amount):
+        n = self.n
+        pheromone = self.pheromone
+        for i in range(start, end):
+            a = path[i]
+            b = path[i + 1]
+            pheromone[a * n + b] += amount
+            pheromone[b * n + a] = pheromone[a * n + b]
+
+    def clamp(self, lower, upper):
+        """Keep every pheromone value within ``[lower, upper]``."""
+        pheromone = self.pheromone
+        for i in range(len(pheromone)):
+            value = pheromone[i]
+            if value < lower:
+                pheromone[i] = lower
+            elif value > upper:
+                pheromone[i] = upper
+
+
+def colony_state(n, params, state=None):
+    """Return ``state`` if it fits this solve, otherwise a fresh ColonyState."""
+    float32 = params.get("float32", False)
+    if state is not None and state.fits(n, params["num_ants"], float32):
+        return state
+    return ColonyState(n, params["num_ants"], float32)
@@ -0,0 +1,104 @@
+import time
+
+from .bound import nearest_neighbour_tour, tour_cost
+from .elitist import solve_tsp as solve_elitist
+from .exact import DEFAULT_MEMORY_LIMIT_MB, max_exact_nodes, shortest_path_through
+from .exact import solve_tsp as solve_exact
+
+# Time allowed for the exact DP when no budget is given (about 16 nodes)
+EXACT_TIME_LIMIT = 0.5
+# Fewest colony iterations worth running inside a time budget
+MIN_COLONY_ITERATIONS = 10
+WINDOW_SIZE = 8
+
+# Rough per-operation timings of the pure Python solvers, used for budgeting
+SECONDS_PER_DP_STEP = 5e-8
+SECONDS_PER_EDGE = 2.5e-7
+
+
+def exact_seconds(n):
+    """Estimated run time of the exact DP for ``n`` nodes."""
+    free = max(n - 1, 0)
+    return SECONDS_PER_DP_STEP * (1 << free) * free * free
+
+def colony_iteration_seconds(n, params):
+    """Estimated run time of one colony iteration for ``n`` nodes."""
+    return SECONDS_PER_EDGE * params["num_ants"] * n * n / 2
+
+def choose_solver(n, params):
+    """Pick "exact", "portfolio", "elitist" or "decomposition" for size ``n``.
+
+    ``params["time_budget"]`` (seconds) and ``params["memory_limit_mb"]`` are
+    both optional. The exact DP is used when it fits the memory limit and the
+    budget (EXACT_TIME_LIMIT without one). The portfolio is only used when
+    ``params["portfolio"]`` is set, and decomposition only when the budget is
+    too small for the colony.
+    """
+    budget = params.get("time_budget")
+    limit = params.get("memory_limit_mb", DEFAULT_MEMORY_LIMIT_MB)
+    exact_budget = EXACT_TIME_LIMIT if budget is None else budget
+
+    if n <= max_exact_nodes(limit) and exact_seconds(n) <= exact_budget:
+        return "exact"
+    if params.get("portfolio"):
+        return "portfolio"
+    if budget is not None and budget < MIN_COLONY_ITERATIONS * colony_iteration_seconds(n, params):
+        return "decomposition"
+    return "elitist"
+
+def solve_decomposed(matrix, params):
+    """Improve a nearest neighbour tour by re-solving windows of it exactly.
+
+    Each window of ``params["window_size"]`` consecutive stops is reordered
+    optimally between its fixed neighbours. Windows overlap by half, and
+    passes repeat until nothing improves or the time budget runs out.
+    """
+    n = len(matrix)
+    window = min(params.get("window_size", WINDOW_SIZE), n - 1)
+    limit = params.get("memory_limit_mb", DEFAULT_MEMORY_LIMIT_MB)
+    budget = params.get("time_budget")
+    deadline = None if budget is None else time.time() + budget
+
+    path = nearest_neighbour_tour(matrix)
+    step = max(window // 2, 1)
+    starts = list(range(0, n - window, step))
+    if starts and starts[-1] != n - window - 1:
+        # Always include the window that ends at the closing depot
+        starts.append(n - window - 1)
+    improved = window > 1
+    while improved:
+        improved = False
+        for i in starts:
+            if deadline is not None and time.time() > deadline:
+                return path
+            end = i + window + 1
+            current = tour_cost(path[i:end + 1], matrix)
+            cost, order = shortest_path_through(matrix, path[i], path[i + 1:end], path[end], limit)
+            if cost < current:
+                path[i + 1:end] = order
+                improved = True
+
+    return path
+
+def solve_tsp(matrix, params):
+    """Solve with the solver chosen by ``choose_solver`` for this instance.
+
+    ``params`` holds the EAS parameters used when the colony is picked; with
+    a time budget its iterations are capped to fit.
+    """
+    n = len(matrix)
+    solver = choose_solver(n, params)
+    if solver == "exact":
+        return solve_exact(matrix, params)
+    if solver == "decomposition":
+        return solve_decomposed(matrix, params)
+    if solver == "portfolio":
+        # Imported here so callers that never race solvers skip multiprocessing
+        from .portfolio import solve_tsp as solve_portfolio
+        return solve_portfolio(matrix, params)
+
+    budget = params.get("time_budget")
+    if budget is not None:
+        fit = int(budget / colony_iteration_seconds(n, params))
+        params = {**params, "num_iterations": min(params["num_iterations"], fit)}
+    return solve_elitist(matrix, params)
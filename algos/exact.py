@@ -0,0 +1,101 @@
+from array import array
+
+# Bytes per DP entry: one double for the cost plus one byte for the parent
+BYTES_PER_ENTRY = 9
+DEFAULT_MEMORY_LIMIT_MB = 64
+
+
+def dp_memory_bytes(num_free):
+    """Memory needed by the bitmask DP tables for ``num_free`` free nodes."""
+    return (1 << num_free) * num_free * BYTES_PER_ENTRY
+
+def max_exact_nodes(memory_limit_mb=DEFAULT_MEMORY_LIMIT_MB):
+    """Largest tour size the exact solver can handle within the memory limit."""
+    n = 1
+    while dp_memory_bytes(n) <= memory_limit_mb * 1024 * 1024:
+        n += 1
+    return n
+
+def shortest_path_through(matrix, start, nodes, end, memory_limit_mb=DEFAULT_MEMORY_LIMIT_MB):
+    """Cheapest path from ``start`` through every node of ``nodes`` to ``end``.
+
+    Held-Karp dynamic programming over bitmasks of ``nodes``. ``cost`` and
+    ``parent`` are flat arrays indexed ``mask * m + last``, so the tables
+    take 9 bytes per (subset, last node) pair. Returns ``(cost, order)``
+    where ``order`` is the optimal ordering of ``nodes``.
+    """
+    m = len(nodes)
+    if m == 0:
+        return matrix[start][end], []
+    if m > 127 or dp_memory_bytes(m) > memory_limit_mb * 1024 * 1024:
+        raise MemoryError(
+            f"Exact DP over {m} nodes needs {dp_memory_bytes(m) / 2 ** 20:.1f} MB, "
+            f"limit is {memory_limit_mb} MB"
+        )
+
+    # Local cost tables: into[last][k] is the cost of edge nodes[k] -> nodes[last]
+    into = [[matrix[nodes[k]][nodes[last]] for k in range(m)] for last in range(m)]
+    size = 1 << m
+    inf = float('inf')
+    cost = array("d", [inf]) * (size * m)
+    parent = array("b", [-1]) * (size * m)
+
+    for last in range(m):
+        cost[(1 << last) * m + last] = matrix[start][nodes[last]]
+
+    members = []
+    for mask in range(1, size):
+        members.clear()
+        bits = mask
+        while bits:
+            low = bits & -bits
+            members.append(low.bit_length() - 1)
+            bits ^= low
+        if len(members) < 2:
+            continue
+        base = mask * m
+        for last in members:
+            prev = (mask ^ (1 << last)) * m
+            row = into[last]
+            best = inf
+            best_k = -1
+            for k in members:
+                value = cost[prev + k] + row[k]
+                if value < best:
+                    best = value
+                    best_k = k
+            cost[base + last] = best
+            parent[base + last] = best_k
+
+    full = size - 1
+    best = inf
+    last = -1
+    for k in range(m):
+        value = cost[full * m + k] + matrix[nodes[k]][end]
+        if value < best:
+            best = value
+            last = k
+
+    order = []
+    mask = full
+    while last >= 0:
+        order.append(nodes[last])
+        prev = parent[mask * m + last]
+        mask ^= 1 << last
+        last = prev
+    order.reverse()
+    return best, order
+
+def solve_tsp(matrix, params=None):
+    """Solve the TSP exactly with bitmask dynamic programming.
+
+    ``params["memory_limit_mb"]`` bounds the size of the DP tables; larger
+    instances raise MemoryError.
+    """
+    params = params or {}
+    n = len(matrix)
+    if n < 2:
+        return [0] * (n + 1)
+    limit = params.get("memory_limit_mb", DEFAULT_MEMORY_LIMIT_MB)
+    _, order = shortest_path_through(matrix, 0, list(range(1, n)), 0, limit)
+    return [0] + order + [0]
@@ -0,0 +1,195 @@
+import os
+import queue
+import random
+import multiprocessing
+
+from .bound import nearest_neighbour_tour, target_cost
+from .genetic import calculate_cost, create_individual, next_generation
+from .stopping import should_stop
+
+MIGRATION_INTERVAL = 20
+MIGRANTS = 2
+TOPOLOGIES = ("ring", "complete")
+# Seconds between liveness checks while waiting for island results
+JOIN_POLL_INTERVAL = 0.5
+
+
+def neighbours(island, num_islands, topology):
+    """Islands that receive migrants from ``island``."""
+    if num_islands < 2:
+        return []
+    if topology == "ring":
+        return [(island + 1) % num_islands]
+    if topology == "complete":
+        return [other for other in range(num_islands) if other != island]
+    raise ValueError(f"Unknown migration topology: {topology}")
+
+def evolve_island(island, matrix, params, seed, inboxes, reports, results, stop):
+    """Evolve one sub-population, exchanging migrants through ``inboxes``.
+
+    Runs in a worker process. Every ``migration_interval`` generations the
+    best ``migrants`` individuals are sent to the neighbouring islands,
+    received migrants replace the worst individuals, and an improved island
+    best is published on ``reports``. The final best goes to ``results``,
+    even if evolution fails, so ``IslandModel.join`` never waits on it.
+    """
+    # Migrants still buffered at exit may be dropped instead of blocking it
+    for inbox in inboxes:
+        inbox.cancel_join_thread()
+    reports.cancel_join_thread()
+
+    best_individual = None
+    best_cost = float('inf')
+    try:
+        best_cost, best_individual = _evolve(island, matrix, params, seed, inboxes, reports, stop)
+    finally:
+        results.put((island, best_cost, best_individual))
+
+def _evolve(island, matrix, params, seed, inboxes, reports, stop):
+    """Body of ``evolve_island``; returns the island best ``(cost, path)``."""
+    rng = random.Random(seed)
+    n = len(matrix)
+    interval = params.get("migration_interval", MIGRATION_INTERVAL)
+    migrants = params.get("migrants", MIGRANTS)
+    targets = neighbours(island, len(inboxes), params.get("topology", "ring"))
+    target = params.get("target_cost")
+
+    def cost(path):
+        return calculate_cost(path, matrix)
+
+    population = [create_individual(n, rng) for _ in range(params["island_population"])]
+    best_individual = None
+    best_cost = float('inf')
+    reported = best_cost
+
+    for generation in range(params["num_generations"]):
+        population = sorted(population, key=cost)
+        if cost(population[0]) < best_cost:
+            best_cost = cost(population[0])
+            best_individual = population[0]
+
+        # Reaching the target, the deadline or a cancellation stops every island
+        if should_stop(best_cost, target, params):
+            stop.set()
+        if stop.is_set():
+            break
+
+        if generation and generation % interval == 0:
+            for other in targets:
+                inboxes[other].put([list(path) for path in population[:migrants]])
+            arrivals = []
+            while True:
+                try:
+                    arrivals.extend(inboxes[island].get_nowait())
+                except queue.Empty:
+                    break
+            arrivals = arrivals[:len(population) // 2]
+            if arrivals:
+                population = sorted(population[:len(population) - len(arrivals)] + arrivals, key=cost)
+            if best_cost < reported:
+                reports.put((island, best_cost, best_individual))
+                reported = best_cost
+
+        population = next_generation(population, n, params, rng)
+
+    return best_cost, best_individual
+
+
+class IslandModel:
+    """Island-model genetic algorithm running one sub-population per process.
+
+    ``params`` takes the genetic.py parameters plus ``num_islands`` (default
+    the CPU count), ``migration_interval``, ``migrants``, ``topology``
+    ("ring" or "complete") and ``seed``. ``population_size`` is split across
+    the islands. ``deadline`` and ``stop_event`` end the run as in the other
+    solvers.
+    """
+
+    def __init__(self, matrix, params):
+        self.matrix = matrix
+        self.num_islands = params.get("num_islands") or os.cpu_count() or 1
+        if not isinstance(self.num_islands, int) or self.num_islands < 1:
+            raise ValueError(f"num_islands must be a positive integer, got {self.num_islands!r}")
+        topology = params.get("topology", "ring")
+        if topology not in TOPOLOGIES:
+            raise ValueError(f"Unknown migration topology: {topology}")
+        self.params = {
+            **params,
+            "island_population": max(params["population_size"] // self.num_islands, 4),
+            "target_cost": target_cost(matrix, params),
+        }
+        self.best_cost = float('inf')
+        self.best_path = None
+        self.processes = []
+
+    def start(self):
+        """Launch the island processes."""
+        seed = self.params.get("seed")
+        if seed is None:
+            seed = random.randrange(2 ** 32)
+        self.inboxes = [multiprocessing.Queue() for _ in range(self.num_islands)]
+        self.reports = multiprocessing.Queue()
+        self.results = multiprocessing.Queue()
+        self.stop_event = multiprocessing.Event()
+        self.processes = [
+            multiprocessing.Process(
+                target=evolve_island,
+                args=(island, self.matrix, self.params, seed + island,
+                      self.inboxes, self.reports, self.results, self.stop_event),
+                daemon=True,
+            )
+            for island in range(self.num_islands)
+        ]
+        for process in self.processes:
+            process.start()
+        return self
+
+    def _record(self, cost, path):
+        if path is not None and cost < self.best_cost:
+            self.best_cost = cost
+            self.best_path = path
+
+    def best(self):
+        """Best tour reported by any island so far, as ``(path, cost)``."""
+        while True:
+            try:
+                _, cost, path = self.reports.get_nowait()
+            except queue.Empty:
+                break
+            self._record(cost, path)
+        return self.best_path, self.best_cost
+
+    def stop(self):
+        """Ask every island to finish after its current generation."""
+        self.stop_event.set()
+
+    def join(self):
+        """Wait for all islands and return the overall best ``(path, cost)``.
+
+        Islands that die without posting a result (e.g. killed) are skipped
+        instead of blocking forever.
+        """
+        pending = len(self.processes)
+        while pending:
+            try:
+                _, cost, path = self.results.get(timeout=JOIN_POLL_INTERVAL)
+            except queue.Empty:
+                if any(process.is_alive() for process in self.processes):
+                    continue
+                # Every island has exited: collect what they posted, then stop
+                try:
+                    _, cost, path = self.results.get(timeout=JOIN_POLL_INTERVAL)
+                except queue.Empty:
+                    break
+            self._record(cost, path)
+            pending -= 1
+        for process in self.processes:
+            process.join()
+        return self.best()
+
+
+def solve_tsp(matrix, params):
+    """Solve the TSP with the island-model GA and return the best path."""
+    path, _ = IslandModel(matrix, params).start().join()
+    # Fall back to a valid tour if no island produced one
+    return path if path is not None else nearest_neighbour_tour(matrix)
@@ -1,65 +1,36 @@
-import random
+from .bound import target_cost
+from .stopping import should_stop
+from .colony import colony_state
 
-def solve_tsp(matrix, params):
+def solve_tsp(matrix, params, state=None):
     n = len(matrix)
-    pheromone = [[params["pheromone_max"] for _ in range(n)] for _ in range(n)]
-    heuristic = [[0 if i == j else 1 / matrix[i][j] for j in range(n)] for i in range(n)]
+    state = colony_state(n, params, state)
+    state.reset(matrix, params["pheromone_max"], params["beta"], params.get("warm_start", False))
+
+    target = target_cost(matrix, params)
 
     best_path = None
     best_cost = float('inf')
 
     for _ in range(params["num_iterations"]):
-        all_paths = []
-        all_costs = []
-
-        for _ in range(params["num_ants"]):
-            path = [0]
-            unvisited = set(range(1, n))
-
-            while unvisited:
-                current = path[-1]
-                probabilities = []
-
-                for city in unvisited:
-                    tau = pheromone[current][city] ** params["alpha"]
-                    eta = heuristic[current][city] ** params["beta"]
-                    probabilities.append((city, tau * eta))
-
-                total = sum(p[1] for p in probabilities)
-                r = random.uniform(0, total)
-                cumulative = 0
-
-                for city, prob in probabilities:
-                    cumulative += prob
-                    if cumulative >= r:
-                        path.append(city)
-                        unvisited.remove(city)
-                        break
-
-            path.append(0)
-            cost = sum(matrix[path[i]][path[i + 1]] for i in range(len(path) - 1))
-            all_paths.append(path)
-            all_costs.append(cost)
+        for k in range(params["num_ants"]):
+            state.construct(k, params["alpha"])
+            cost = state.evaluate(k, matrix)
 
             if cost < best_cost:
                 best_cost = cost
-                best_path = path
+                best_path = state.tour(k)
 
         # Evaporation
-        for i in range(n):
-            for j in range(n):
-                pheromone[i][j] *= (1 - params["evaporation_rate"])
+        state.evaporate(params["evaporation_rate"])
 
         # Reinforcement by best ant
-        for i in range(len(best_path) - 1):
-            a = best_path[i]
-            b = best_path[i + 1]
-            pheromone[a][b] += params["pheromone_constant"] / best_cost
-            pheromone[b][a] = pheromone[a][b]  # symmetric TSP
+        state.deposit_path(best_path, params["pheromone_constant"] / best_cost)  # symmetric TSP
 
         # Enforce pheromone limits
-        for i in range(n):
-            for j in range(n):
-                pheromone[i][j] = max(params["pheromone_min"], min(params["pheromone_max"], pheromone[i][j]))
+        state.clamp(params["pheromone_min"], params["pheromone_max"])
+
+        if should_stop(best_cost, target, params):
+            break
 
     return best_path
@@ -0,0 +1,144 @@
+import json
+import queue
+import time
+import multiprocessing
+
+from .acs import solve_tsp as solve_acs
+from .bound import lower_bound, nearest_neighbour_tour, tour_cost
+from .elitist import solve_tsp as solve_elitist
+from .genetic import solve_tsp as solve_genetic
+from .minmax import solve_tsp as solve_minmax
+
+ACO_PARAMS = {
+    "num_ants": 20,
+    "num_iterations": 100,
+    "alpha": 1.0,
+    "beta": 5.0,
+    "evaporation_rate": 0.5,
+    "pheromone_constant": 100.0
+}
+
+# Solvers raced by default, with their parameters
+PORTFOLIO = {
+    "EAS": (solve_elitist, {**ACO_PARAMS, "elitist_factor": 5}),
+    "MMAS": (solve_minmax, {**ACO_PARAMS, "pheromone_min": 0.1, "pheromone_max": 10.0}),
+    "ACS": (solve_acs, {"num_ants": 10, "num_iterations": 100, "beta": 5.0, "evaporation_rate": 0.1}),
+    "GA": (solve_genetic, {"population_size": 200, "num_generations": 500, "mutation_rate": 0.1, "elitism_rate": 0.3}),
+}
+
+TIME_BUDGET = 5.0
+# Time reserved at the end of the budget for solvers to finish their
+# current iteration and report
+GRACE_PERIOD = 0.25
+
+
+def share_matrix(matrix):
+    """Copy ``matrix`` once into a flat shared-memory array for the workers."""
+    integral = all(isinstance(value, int) for row in matrix for value in row)
+    return multiprocessing.RawArray("q" if integral else "d", [value for row in matrix for value in row])
+
+def matrix_view(shared, n):
+    """Read-only rows over ``shared`` that index like a list of lists, without copying it."""
+    view = memoryview(shared)
+    # ctypes reports e.g. "<q"; cast needs the bare typecode
+    view = view.cast("B").cast(view.format.lstrip("<>=!@")).toreadonly()
+    return [view[i * n:(i + 1) * n] for i in range(n)]
+
+def run_solver(name, solver, params, shared, n, results, stop_event):
+    """Worker process: solve the shared matrix and report the tour."""
+    matrix = matrix_view(shared, n)
+    start_time = time.time()
+    path = solver(matrix, {**params, "stop_event": stop_event})
+    cost = tour_cost(path, matrix)
+    target = params.get("target_cost")
+    if target is not None and cost <= target:
+        # Good enough: cancel the other solvers
+        stop_event.set()
+    results.put((name, cost, path, time.time() - start_time))
+
+def solve_portfolio(matrix, params=None, portfolio=None):
+    """Race several solvers in worker processes under one wall-clock deadline.
+
+    ``params["time_budget"]`` (seconds) bounds the whole call: solvers stop
+    GRACE_PERIOD before it so they can report in time. Workers read one
+    shared, read-only copy of ``matrix``. With ``params["gap_epsilon"]`` the
+    first solver whose tour is within that gap of the lower bound cancels
+    the others. ``portfolio`` maps solver names to ``(solve_tsp, params)``
+    pairs and defaults to PORTFOLIO.
+
+    Returns a dict with the best ``path`` and ``cost``, the ``winner``, and
+    the cost and time of every solver that finished. A nearest neighbour
+    tour ("NN") is always included, so a path is returned even when no
+    solver reports in time. When ``params["record_file"]`` is set the run is
+    appended to it as a JSON line.
+    """
+    params = params or {}
+    portfolio = portfolio or PORTFOLIO
+    n = len(matrix)
+    start_time = time.time()
+    budget = params.get("time_budget", TIME_BUDGET)
+    deadline = start_time + budget
+
+    path = nearest_neighbour_tour(matrix)
+    runs = {"NN": {"cost": tour_cost(path, matrix), "path": path, "time_sec": round(time.time() - start_time, 4)}}
+
+    stopping = {"deadline": start_time + max(budget - GRACE_PERIOD, 0)}
+    if params.get("gap_epsilon") is not None:
+        bound = params.get("lower_bound")
+        if bound is None:
+            bound = lower_bound(matrix)
+        stopping.update({
+            "gap_epsilon": params["gap_epsilon"],
+            "lower_bound": bound,
+            "target_cost": bound * (1 + params["gap_epsilon"]),
+        })
+
+    shared = share_matrix(matrix)
+    results = multiprocessing.Queue()
+    stop_event = multiprocessing.Event()
+    processes = [
+        multiprocessing.Process(
+            target=run_solver,
+            args=(name, solver, {**solver_params, **stopping}, shared, n, results, stop_event),
+            daemon=True,
+        )
+        for name, (solver, solver_params) in portfolio.items()
+    ]
+    for process in processes:
+        process.start()
+
+    for _ in processes:
+        remaining = deadline - time.time()
+        if remaining <= 0:
+            break
+        try:
+            name, cost, path, seconds = results.get(timeout=remaining)
+        except queue.Empty:
+            break
+        runs[name] = {"cost": cost, "path": path, "time_sec": round(seconds, 4)}
+
+    # Solvers still running at the deadline are dropped
+    for process in processes:
+        if process.is_alive():
+            process.terminate()
+        process.join()
+
+    winner = min(runs, key=lambda name: runs[name]["cost"])
+    result = {
+        "winner": winner,
+        "path": runs[winner]["path"],
+        "cost": runs[winner]["cost"],
+        "time_sec": round(time.time() - start_time, 4),
+        "runs": {name: {"cost": run["cost"], "time_sec": run["time_sec"]} for name, run in runs.items()},
+    }
+
+    if params.get("record_file"):
+        record = {"num_nodes": n, **{key: result[key] for key in ("winner", "cost", "time_sec", "runs")}}
+        with open(params["record_file"], "a") as f:
+            f.write(json.dumps(record) + "\n")
+
+    return result
+
+def solve_tsp(matrix, params):
+    """Solve with the solver portfolio and return the best path."""
+    return solve_portfolio(matrix, params)["path"]
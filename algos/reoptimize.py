@@ -0,0 +1,118 @@
+import time
+
+from .bound import tour_cost
+from .colony import colony_state
+from .exact import shortest_path_through
+
+# Remaining routes up to this many stops are repaired exactly
+EXACT_REPAIR_NODES = 12
+MAX_REPAIR_PASSES = 5
+
+
+def cheapest_insertion(route, stop, matrix):
+    """Insert ``stop`` between the pair of consecutive nodes where it adds least."""
+    best_delta = float('inf')
+    best_pos = 1
+    for i in range(len(route) - 1):
+        a = route[i]
+        b = route[i + 1]
+        delta = matrix[a][stop] + matrix[stop][b] - matrix[a][b]
+        if delta < best_delta:
+            best_delta = delta
+            best_pos = i + 1
+    route.insert(best_pos, stop)
+
+def or_opt(route, matrix, max_passes=MAX_REPAIR_PASSES, deadline=None):
+    """Relocate segments of 1-3 stops while that shortens ``route``.
+
+    The first and last nodes of ``route`` stay fixed. Moves are evaluated
+    with directed edge costs, so asymmetric matrices are handled correctly.
+    """
+    for _ in range(max_passes):
+        improved = False
+        for seg_len in (1, 2, 3):
+            i = 1
+            while i + seg_len < len(route):
+                if deadline is not None and time.time() > deadline:
+                    return route
+                a = route[i - 1]
+                first = route[i]
+                last = route[i + seg_len - 1]
+                b = route[i + seg_len]
+                gain = matrix[a][first] + matrix[last][b] - matrix[a][b]
+
+                best_delta = 0
+                best_j = None
+                for j in range(len(route) - 1):
+                    if i - 1 <= j <= i + seg_len - 1:
+                        continue
+                    p = route[j]
+                    q = route[j + 1]
+                    delta = matrix[p][first] + matrix[last][q] - matrix[p][q] - gain
+                    if delta < best_delta:
+                        best_delta = delta
+                        best_j = j
+
+                if best_j is None:
+                    i += 1
+                    continue
+                segment = route[i:i + seg_len]
+                del route[i:i + seg_len]
+                pos = best_j + 1 if best_j < i else best_j + 1 - seg_len
+                route[pos:pos] = segment
+                improved = True
+        if not improved:
+            break
+    return route
+
+def reoptimize(matrix, tour, prefix, added=(), removed=(), params=None):
+    """Re-plan the unvisited part of ``tour`` after stops change.
+
+    ``prefix`` is the part of the route already driven, starting at the
+    depot 0 and ending at the current position. Cancelled stops in
+    ``removed`` are dropped, new stops in ``added`` (indices into
+    ``matrix``) are placed by cheapest insertion, and only the remaining
+    suffix is then repaired: exactly when it is short, otherwise with
+    Or-opt bounded by ``params["max_passes"]`` and ``params["time_budget"]``.
+    Returns the full updated tour, prefix included.
+    """
+    params = params or {}
+    if not prefix or prefix[0] != 0:
+        raise ValueError("Visited prefix must start at the depot (node 0)")
+    if len(prefix) > 1 and prefix[-1] == 0:
+        raise ValueError("Visited prefix already returned to the depot; plan a new route instead")
+    budget = params.get("time_budget")
+    deadline = None if budget is None else time.time() + budget
+
+    visited = set(prefix)
+    skip = visited | set(removed)
+    route = [prefix[-1]] + [stop for stop in tour[1:-1] if stop not in skip] + [0]
+
+    present = set(route) | visited
+    for stop in added:
+        if stop not in present:
+            cheapest_insertion(route, stop, matrix)
+            present.add(stop)
+
+    stops = route[1:-1]
+    if len(stops) <= params.get("exact_repair_nodes", EXACT_REPAIR_NODES):
+        _, stops = shortest_path_through(matrix, route[0], stops, 0)
+        route = [route[0]] + stops + [0]
+    else:
+        or_opt(route, matrix, params.get("max_passes", MAX_REPAIR_PASSES), deadline)
+
+    return list(prefix) + route[1:]
+
+def seed_state(matrix, tour, params, state=None):
+    """Prime a ColonyState with pheromone along ``tour`` for a warm-started solve.
+
+    A state from the previous solve of the same size keeps its learned
+    pheromone; otherwise a fresh state is reset and ``tour`` is reinforced
+    like an elitist best path. Pass the result as ``state`` together with
+    ``params["warm_start"]`` to aco, elitist or minmax.
+    """
+    state = colony_state(len(matrix), params, state)
+    state.reset(matrix, 1.0, params["beta"], keep_pheromone=True)
+    amount = params.get("elitist_factor", 1) * params["pheromone_constant"] / tour_cost(tour, matrix)
+    state.deposit_path(tour, amount)
+    return state
@@ -0,0 +1,17 @@
+import time
+
+
+def should_stop(best_cost, target, params):
+    """Whether a solver should end its run early.
+
+    True once ``best_cost`` reaches ``target`` (see bound.target_cost), the wall
+    clock passes ``params["deadline"]``, or ``params["stop_event"]`` is set
+    by another process.
+    """
+    if target is not None and best_cost <= target:
+        return True
+    deadline = params.get("deadline")
+    if deadline is not None and time.time() >= deadline:
+        return True
+    stop_event = params.get("stop_event")
+    return stop_event is not None and stop_event.is_set()
@@ -0,0 +1,20 @@
+import itertools
+
+from algos.bound import tour_cost
+
+
+def random_matrix(n, rng, symmetric=True, integer=True):
+    value = (lambda: rng.randint(10, 60)) if integer else (lambda: rng.uniform(10, 60))
+    matrix = [[0 if i == j else value() for j in range(n)] for i in range(n)]
+    if symmetric:
+        for i in range(n):
+            for j in range(i):
+                matrix[i][j] = matrix[j][i]
+    return matrix
+
+def brute_force(matrix):
+    n = len(matrix)
+    return min(tour_cost((0,) + order + (0,), matrix) for order in itertools.permutations(range(1, n)))
+
+def is_tour(path, n):
+    return path[0] == path[-1] == 0 and sorted(path[:-1]) == list(range(n))
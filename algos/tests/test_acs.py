@@ -0,0 +1,65 @@
+import random
+
+import pytest
+
+from algos.acs import construct, solve_tsp
+from algos.bound import nearest_neighbour_cost, nearest_neighbour_tour, tour_cost
+from algos.colony import colony_state
+
+from .helpers import is_tour, random_matrix
+
+PARAMS = {"num_ants": 5, "num_iterations": 10, "beta": 2.0, "evaporation_rate": 0.1}
+
+
+@pytest.mark.parametrize("candidate_size", [3, 15])
+def test_acs_returns_tour(candidate_size):
+    matrix = random_matrix(20, random.Random(32))
+    path = solve_tsp(matrix, {**PARAMS, "candidate_size": candidate_size})
+    assert is_tour(path, 20)
+
+@pytest.mark.parametrize("n", [0, 1])
+def test_acs_trivial_sizes(n):
+    matrix = [[0] * n for _ in range(n)]
+    assert solve_tsp(matrix, PARAMS) == [0] * (n + 1)
+
+def test_greedy_rule_follows_nearest_neighbour():
+    # With q0 = 1 and uniform pheromone every step takes the closest city
+    matrix = random_matrix(15, random.Random(32), integer=False)
+    params = {**PARAMS, "num_ants": 1, "num_iterations": 1, "q0": 1.0}
+    assert solve_tsp(matrix, params) == nearest_neighbour_tour(matrix)
+
+def test_local_update_moves_pheromone_towards_tau0():
+    n = 12
+    matrix = random_matrix(n, random.Random(32))
+    params = {**PARAMS, "num_ants": 1, "local_evaporation": 0.2}
+    state = colony_state(n, params)
+    state.reset(matrix, 1.0, params["beta"])
+    tau0 = 0.01
+    construct(state, 0, [list(range(n))] * n, params, tau0, bytearray(n))
+
+    tour = state.tour(0)
+    used = {(a, b) for a, b in zip(tour, tour[1:])}
+    used |= {(b, a) for a, b in used}
+    for i in range(n):
+        for j in range(n):
+            expected = 0.8 * 1.0 + 0.2 * tau0 if (i, j) in used else 1.0
+            assert state.pheromone[i * n + j] == pytest.approx(expected)
+
+def test_global_update_reinforces_best_tour_only():
+    n = 12
+    matrix = random_matrix(n, random.Random(32))
+    # No local update, so any pheromone change comes from the global update
+    params = {**PARAMS, "num_ants": 4, "num_iterations": 1, "q0": 0.0, "local_evaporation": 0.0}
+    state = colony_state(n, params)
+    random.seed(32)
+    best = solve_tsp(matrix, params, state)
+
+    tau0 = 1 / (n * nearest_neighbour_cost(matrix))
+    rho = params["evaporation_rate"]
+    used = {(a, b) for a, b in zip(best, best[1:])}
+    used |= {(b, a) for a, b in used}
+    assert len({tuple(state.tour(k)) for k in range(4)}) > 1
+    for i in range(n):
+        for j in range(n):
+            expected = (1 - rho) * tau0 + rho / tour_cost(best, matrix) if (i, j) in used else tau0
+            assert state.pheromone[i * n + j] == pytest.approx(expected)
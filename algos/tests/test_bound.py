@@ -0,0 +1,44 @@
+import random
+
+import pytest
+
+from algos import elitist
+from algos.bound import lower_bound
+
+from .helpers import brute_force, is_tour, random_matrix
+
+
+@pytest.mark.parametrize("symmetric", [True, False])
+@pytest.mark.parametrize("integer", [True, False])
+def test_lower_bound_never_exceeds_optimum(symmetric, integer):
+    rng = random.Random(27)
+    for n in range(2, 9):
+        for _ in range(5):
+            matrix = random_matrix(n, rng, symmetric, integer)
+            assert lower_bound(matrix) <= brute_force(matrix) + 1e-9
+
+def test_gap_epsilon_stops_early(monkeypatch):
+    matrix = random_matrix(8, random.Random(3))
+    params = {
+        "num_ants": 5,
+        "num_iterations": 1000,
+        "alpha": 1.0,
+        "beta": 5.0,
+        "evaporation_rate": 0.5,
+        "pheromone_constant": 100.0,
+        "elitist_factor": 5,
+        "gap_epsilon": 10.0,
+    }
+    checks = []
+    original = elitist.should_stop
+
+    def counting_should_stop(best_cost, target, params):
+        checks.append(best_cost)
+        return original(best_cost, target, params)
+
+    monkeypatch.setattr(elitist, "should_stop", counting_should_stop)
+    path = elitist.solve_tsp(matrix, params)
+
+    # Any tour is within 1000% of the bound, so the first iteration stops
+    assert len(checks) == 1
+    assert is_tour(path, 8)
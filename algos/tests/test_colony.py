@@ -0,0 +1,73 @@
+import random
+
+import pytest
+
+from algos import aco, elitist, minmax
+from algos.colony import ColonyState, colony_state
+
+from .helpers import is_tour, random_matrix
+
+ACO_PARAMS = {
+    "num_ants": 5,
+    "num_iterations": 10,
+    "alpha": 1.0,
+    "beta": 5.0,
+    "evaporation_rate": 0.5,
+    "pheromone_constant": 100.0,
+}
+
+SOLVERS = [
+    (aco.solve_tsp, ACO_PARAMS),
+    (elitist.solve_tsp, {**ACO_PARAMS, "elitist_factor": 5}),
+    (minmax.solve_tsp, {**ACO_PARAMS, "pheromone_min": 0.1, "pheromone_max": 10.0}),
+]
+
+
+def test_construct_builds_tours():
+    random.seed(26)
+    matrix = random_matrix(12, random.Random(26))
+    state = ColonyState(12, 4)
+    state.reset(matrix, 1.0, 2.0)
+    for k in range(4):
+        state.construct(k, 1.0)
+        assert is_tour(state.tour(k), 12)
+        assert state.evaluate(k, matrix) == sum(matrix[a][b] for a, b in zip(state.tour(k), state.tour(k)[1:]))
+
+def test_float32_buffers():
+    state = colony_state(6, {"num_ants": 3, "float32": True})
+    assert state.pheromone.typecode == state.heuristic.typecode == "f"
+    assert colony_state(6, {"num_ants": 3}).pheromone.typecode == "d"
+
+def test_colony_state_reuses_only_fitting_states():
+    state = ColonyState(6, 3)
+    assert colony_state(6, {"num_ants": 3}, state) is state
+    assert colony_state(7, {"num_ants": 3}, state) is not state
+    assert colony_state(6, {"num_ants": 4}, state) is not state
+    assert colony_state(6, {"num_ants": 3, "float32": True}, state) is not state
+
+def test_deposit_is_symmetric_and_clamp_bounds_pheromone():
+    state = ColonyState(4, 1)
+    state.reset(random_matrix(4, random.Random(1)), 1.0, 1.0)
+    state.deposit_path([0, 2, 1, 3, 0], 20.0)
+    assert state.pheromone[0 * 4 + 2] == state.pheromone[2 * 4 + 0] == 21.0
+    state.evaporate(0.99)
+    state.clamp(0.1, 10.0)
+    assert all(0.1 <= value <= 10.0 for value in state.pheromone)
+    assert state.pheromone[0 * 4 + 2] == pytest.approx(0.21)
+    assert state.pheromone[0 * 4 + 1] == pytest.approx(0.1)
+
+@pytest.mark.parametrize("solver, params", SOLVERS)
+@pytest.mark.parametrize("float32", [False, True])
+def test_solvers_return_tours(solver, params, float32):
+    random.seed(26)
+    matrix = random_matrix(15, random.Random(26), symmetric=False)
+    assert is_tour(solver(matrix, {**params, "float32": float32}), 15)
+
+@pytest.mark.parametrize("solver, params", SOLVERS)
+def test_state_reused_across_solves(solver, params):
+    rng = random.Random(26)
+    state = colony_state(10, params)
+    pheromone = state.pheromone
+    for _ in range(3):
+        assert is_tour(solver(random_matrix(10, rng), params, state), 10)
+    assert state.pheromone is pheromone
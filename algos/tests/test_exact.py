@@ -0,0 +1,52 @@
+import random
+
+import pytest
+
+from algos import dispatch
+from algos.bound import tour_cost
+from algos.exact import shortest_path_through, solve_tsp
+
+from .helpers import brute_force, is_tour, random_matrix
+
+
+@pytest.mark.parametrize("symmetric", [True, False])
+def test_exact_matches_brute_force(symmetric):
+    rng = random.Random(28)
+    for n in range(2, 9):
+        for _ in range(10):
+            matrix = random_matrix(n, rng, symmetric)
+            path = solve_tsp(matrix)
+            assert is_tour(path, n)
+            assert tour_cost(path, matrix) == brute_force(matrix)
+
+def test_exact_trivial_sizes():
+    assert solve_tsp([[0]]) == [0, 0]
+    assert solve_tsp([[0, 4], [7, 0]]) == [0, 1, 0]
+
+def test_shortest_path_through_respects_memory_limit():
+    matrix = random_matrix(14, random.Random(1))
+    with pytest.raises(MemoryError):
+        shortest_path_through(matrix, 0, list(range(1, 14)), 0, memory_limit_mb=0.5)
+
+def test_decomposition_reorders_last_window(monkeypatch):
+    # 150 nodes, window 8, step 4: the last window start is off the step grid
+    n = 150
+    matrix = random_matrix(n, random.Random(5))
+    ends = []
+    original = dispatch.shortest_path_through
+
+    def recording(matrix, start, nodes, end, limit):
+        ends.append(end)
+        return original(matrix, start, nodes, end, limit)
+
+    monkeypatch.setattr(dispatch, "shortest_path_through", recording)
+    path = dispatch.solve_decomposed(matrix, {"window_size": 8})
+
+    assert is_tour(path, n)
+    # Only the window ending at path[n] has the depot as its end node
+    assert 0 in ends
+
+def test_dispatch_keeps_colony_without_budget():
+    assert dispatch.choose_solver(200, {"num_ants": 20}) == "elitist"
+    assert dispatch.choose_solver(10, {"num_ants": 20}) == "exact"
+    assert dispatch.choose_solver(200, {"num_ants": 20, "time_budget": 0.01}) == "decomposition"
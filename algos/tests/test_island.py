@@ -0,0 +1,57 @@
+import multiprocessing
+import random
+import time
+
+import pytest
+
+from algos.island import IslandModel, solve_tsp
+
+from .helpers import is_tour, random_matrix
+
+PARAMS = {
+    "population_size": 16,
+    "num_generations": 30,
+    "mutation_rate": 0.1,
+    "elitism_rate": 0.3,
+    "num_islands": 2,
+    "migration_interval": 5,
+    "seed": 31,
+}
+
+
+def test_island_model_returns_tour():
+    matrix = random_matrix(12, random.Random(31))
+    assert is_tour(solve_tsp(matrix, PARAMS), 12)
+
+def test_failing_islands_do_not_hang_join():
+    # Crossover needs at least two free stops, so every island raises
+    matrix = random_matrix(2, random.Random(31))
+    assert solve_tsp(matrix, PARAMS) == [0, 1, 0]
+
+def test_join_skips_killed_islands():
+    matrix = random_matrix(12, random.Random(31))
+    model = IslandModel(matrix, {**PARAMS, "num_generations": 10 ** 6}).start()
+    for process in model.processes:
+        process.terminate()
+    path, cost = model.join()
+    assert path is None or is_tour(path, 12)
+
+@pytest.mark.parametrize("bad", [{"topology": "star"}, {"num_islands": -1}, {"num_islands": 1.5}])
+def test_invalid_params_raise_in_caller(bad):
+    matrix = random_matrix(6, random.Random(31))
+    with pytest.raises(ValueError):
+        IslandModel(matrix, {**PARAMS, **bad})
+
+def test_islands_respect_deadline():
+    matrix = random_matrix(12, random.Random(31))
+    start = time.time()
+    path = solve_tsp(matrix, {**PARAMS, "num_generations": 10 ** 6, "deadline": start + 0.5})
+    assert time.time() - start < 5
+    assert is_tour(path, 12)
+
+def test_islands_can_be_cancelled():
+    matrix = random_matrix(12, random.Random(31))
+    stop_event = multiprocessing.Event()
+    stop_event.set()
+    path = solve_tsp(matrix, {**PARAMS, "num_generations": 10 ** 6, "stop_event": stop_event})
+    assert is_tour(path, 12)
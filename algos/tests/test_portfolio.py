@@ -0,0 +1,40 @@
+import random
+import time
+
+import pytest
+
+from algos.genetic import solve_tsp as solve_genetic
+from algos.portfolio import matrix_view, share_matrix, solve_portfolio
+
+from .helpers import is_tour, random_matrix
+
+
+def slow_solver(matrix, params):
+    # Ignores the deadline, so the portfolio has to drop it
+    time.sleep(30)
+    return list(range(len(matrix))) + [0]
+
+def test_portfolio_respects_budget_and_falls_back():
+    matrix = random_matrix(10, random.Random(33))
+    start = time.time()
+    result = solve_portfolio(matrix, {"time_budget": 0.5}, {"SLOW": (slow_solver, {})})
+    assert time.time() - start < 1.5
+    assert result["winner"] == "NN"
+    assert is_tour(result["path"], 10)
+    assert "SLOW" not in result["runs"]
+
+def test_portfolio_reports_finished_solvers():
+    matrix = random_matrix(10, random.Random(33))
+    params = {"population_size": 20, "num_generations": 20, "mutation_rate": 0.1, "elitism_rate": 0.3}
+    result = solve_portfolio(matrix, {"time_budget": 5.0}, {"GA": (solve_genetic, params)})
+    assert set(result["runs"]) == {"NN", "GA"}
+    assert is_tour(result["path"], 10)
+    assert result["cost"] == min(run["cost"] for run in result["runs"].values())
+
+@pytest.mark.parametrize("integer", [True, False])
+def test_matrix_view_reads_shared_matrix(integer):
+    matrix = random_matrix(7, random.Random(33), integer=integer)
+    view = matrix_view(share_matrix(matrix), 7)
+    assert [list(row) for row in view] == matrix
+    with pytest.raises(TypeError):
+        view[1][2] = 0
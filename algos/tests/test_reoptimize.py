@@ -0,0 +1,113 @@
+import random
+
+import pytest
+
+from algos import elitist
+from algos.bound import nearest_neighbour_tour, tour_cost
+from algos.colony import colony_state
+from algos.reoptimize import or_opt, reoptimize, seed_state
+
+from .helpers import is_tour, random_matrix
+
+
+EAS_PARAMS = {
+    "num_ants": 5,
+    "num_iterations": 5,
+    "alpha": 1.0,
+    "beta": 2.0,
+    "evaporation_rate": 0.5,
+    "pheromone_constant": 100.0,
+    "elitist_factor": 5,
+}
+
+
+def check_update(new, prefix, tour, added, removed, n):
+    assert new[:len(prefix)] == prefix
+    assert new[-1] == 0
+    assert 0 not in new[len(prefix):-1]
+    expected = (set(tour) | set(added)) - (set(removed) - set(prefix))
+    assert sorted(new[:-1]) == sorted(expected)
+
+@pytest.mark.parametrize("n", [10, 40])
+@pytest.mark.parametrize("symmetric", [True, False])
+def test_reoptimize_updates_suffix_only(n, symmetric):
+    rng = random.Random(30)
+    matrix = random_matrix(n + 3, rng, symmetric)
+    stops = list(range(1, n))
+    rng.shuffle(stops)
+    tour = [0] + stops + [0]
+    prefix = tour[:n // 3]
+    added = [n, n + 1, n + 2]
+    removed = [tour[n // 2], tour[n // 2 + 1], prefix[1]]
+
+    new = reoptimize(matrix, tour, prefix, added, removed)
+
+    check_update(new, prefix, tour, added, removed, n)
+    # prefix[1] was already visited, so cancelling it has no effect
+    assert new.count(prefix[1]) == 1
+
+def test_reoptimize_ignores_duplicate_additions():
+    matrix = random_matrix(8, random.Random(1))
+    tour = [0, 1, 2, 3, 4, 5, 6, 0]
+    new = reoptimize(matrix, tour, [0, 1], added=[7, 7, 3])
+    assert sorted(new[:-1]) == list(range(8))
+
+def test_reoptimize_rejects_bad_prefix():
+    matrix = random_matrix(5, random.Random(2))
+    tour = [0, 1, 2, 3, 4, 0]
+    with pytest.raises(ValueError):
+        reoptimize(matrix, tour, [1, 2])
+    with pytest.raises(ValueError):
+        reoptimize(matrix, tour, tour)
+
+def test_or_opt_keeps_endpoints_and_never_worsens():
+    rng = random.Random(3)
+    for symmetric in (True, False):
+        matrix = random_matrix(30, rng, symmetric)
+        route = [5] + [city for city in range(30) if city not in (0, 5)] + [0]
+        before = tour_cost(route, matrix)
+        result = or_opt(list(route), matrix)
+        assert result[0] == 5 and result[-1] == 0
+        assert sorted(result) == sorted(route)
+        assert tour_cost(result, matrix) <= before
+
+def test_seed_state_reinforces_tour():
+    matrix = random_matrix(10, random.Random(4))
+    tour = nearest_neighbour_tour(matrix)
+    state = seed_state(matrix, tour, EAS_PARAMS)
+    on_tour = {(a, b) for a, b in zip(tour, tour[1:])}
+    for i in range(10):
+        for j in range(10):
+            expected = 1.0
+            if (i, j) in on_tour or (j, i) in on_tour:
+                expected += 5 * 100.0 / tour_cost(tour, matrix)
+            assert state.pheromone[i * 10 + j] == pytest.approx(expected)
+
+def test_seed_state_keeps_learned_pheromone():
+    matrix = random_matrix(10, random.Random(5))
+    tour = nearest_neighbour_tour(matrix)
+    state = seed_state(matrix, tour, EAS_PARAMS)
+    before = state.pheromone.tolist()
+    assert seed_state(matrix, tour, EAS_PARAMS, state) is state
+    amount = 5 * 100.0 / tour_cost(tour, matrix)
+    assert state.pheromone[tour[0] * 10 + tour[1]] == pytest.approx(before[tour[0] * 10 + tour[1]] + amount)
+
+def test_warm_start_from_seeded_state():
+    random.seed(6)
+    matrix = random_matrix(20, random.Random(6))
+    tour = nearest_neighbour_tour(matrix)
+    params = {**EAS_PARAMS, "warm_start": True}
+    path = elitist.solve_tsp(matrix, params, seed_state(matrix, tour, params))
+    assert is_tour(path, 20)
+
+def test_warm_start_without_learned_pheromone_initialises_it():
+    matrix = random_matrix(20, random.Random(7))
+    params = {**EAS_PARAMS, "warm_start": True}
+    # Neither a missing state nor a fresh one has pheromone to keep
+    state = colony_state(20, params)
+    state.reset(matrix, 1.0, params["beta"], keep_pheromone=True)
+    assert set(state.pheromone) == {1.0}
+
+    random.seed(7)
+    tours = {tuple(elitist.solve_tsp(matrix, params)) for _ in range(5)}
+    assert len(tours) > 1